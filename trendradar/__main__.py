@@ -6,7 +6,10 @@ TrendRadar 主程序
 支持: python -m trendradar
 """
 
+import logging
 import os
+import sqlite3
+import sys
 import webbrowser
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
@@ -132,22 +135,40 @@ class NewsAnalyzer:
     def _init_ai_summarizer(self) -> None:
         """初始化 AI 总结器"""
         api_key = os.environ.get("DEEPSEEK_API_KEY", "")
+        # 多账号密钥（";" 分隔），由 DeepSeekClient 解析
+        has_api_key = bool(api_key or os.environ.get("DEEPSEEK_API_KEYS", "").strip())
         ai_config = self.ctx.config.get("AI_SUMMARY", {})
-        self.enable_ai_summary = bool(api_key) and ai_config.get("ENABLED", True)
+        self.enable_ai_summary = has_api_key and ai_config.get("ENABLED", True)
 
         if self.enable_ai_summary:
             try:
-                from trendradar.ai import NewsSummarizer
+                from trendradar.ai import NewsSummarizer, ResponseCache
                 model = ai_config.get("MODEL", "deepseek-ai/DeepSeek-V3")
-                self.ai_summarizer = NewsSummarizer(api_key=api_key, model=model)
+                cache_config = ai_config.get("CACHE", {})
+                cache = None
+                if cache_config.get("ENABLED", False):
+                    try:
+                        cache = ResponseCache(
+                            db_path=cache_config.get("PATH", "output/ai_cache.db"),
+                            ttl=cache_config.get("TTL", 86400),
+                        )
+                    except (OSError, sqlite3.Error) as e:
+                        print(f"⚠️ AI 总结缓存初始化失败，将不使用缓存: {e}")
+                        cache = None
+                self.ai_summarizer = NewsSummarizer(api_key=api_key, model=model, cache=cache)
                 print(f"AI 总结功能已启用，使用模型: {model}")
+                key_count = len(self.ai_summarizer.client.api_keys)
+                if key_count > 1:
+                    print(f"AI 总结将并行使用 {key_count} 个 API 密钥")
+                if cache:
+                    print(f"AI 总结缓存已启用: {cache.db_path}")
             except ImportError as e:
                 print(f"⚠️ AI 模块加载失败: {e}")
                 self.enable_ai_summary = False
                 self.ai_summarizer = None
         else:
             self.ai_summarizer = None
-            if not api_key:
+            if not has_api_key:
                 print("AI 总结功能未启用（未配置 DEEPSEEK_API_KEY）")
             else:
                 print("AI 总结功能已禁用（AI_SUMMARY.ENABLED=false）")
@@ -405,7 +426,10 @@ class NewsAnalyzer:
             ai_summary = None
             if self.enable_ai_summary and self.ai_summarizer:
                 print("正在生成 AI 新闻总结...")
-                ai_summary = self.ai_summarizer.summarize_news(stats)
+                if len(self.ai_summarizer.client.api_keys) > 1:
+                    ai_summary = self.ai_summarizer.summarize_news_parallel(stats)
+                else:
+                    ai_summary = self.ai_summarizer.summarize_news(stats)
 
             # 准备报告数据（传入 AI 总结内容）
             report_data = self.ctx.prepare_report(
@@ -752,10 +776,31 @@ class NewsAnalyzer:
         finally:
             # 清理资源（包括过期数据清理和数据库连接关闭）
             self.ctx.cleanup()
+            if self.ai_summarizer:
+                self.ai_summarizer.close()
+
+
+def _setup_logging() -> None:
+    """
+    配置 trendradar 包的日志输出（AI 模块等使用 logging）
+
+    只作用于 trendradar 命名空间，以纯文本输出到 stdout，与其余 print 输出保持一致；
+    不修改根 logger，避免第三方库日志混入
+    """
+    logger = logging.getLogger("trendradar")
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    level = getattr(logging, os.environ.get("LOG_LEVEL", "").strip().upper(), None)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    logger.propagate = False
 
 
 def main():
     """主程序入口"""
+    _setup_logging()
     try:
         analyzer = NewsAnalyzer()
         analyzer.run()
@@ -0,0 +1,121 @@
+# coding=utf-8
+"""
+AI 响应缓存
+
+基于 SQLite 的精确匹配缓存：相同模型 + 系统提示词 + 用户提示词
+直接返回上次的生成结果，避免重复调用 API
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """AI 响应缓存（精确匹配）"""
+
+    def __init__(self, db_path: str = "output/ai_cache.db", ttl: int = 86400):
+        """
+        初始化缓存
+
+        Args:
+            db_path: SQLite 数据库文件路径
+            ttl: 缓存有效期（秒），小于等于 0 表示永不过期
+        """
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT,
+                    created_at REAL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """创建数据库连接（每次操作独立连接，支持多线程调用）"""
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str) -> str:
+        """
+        生成缓存键
+
+        Args:
+            model: 模型名称
+            system_prompt: 系统提示词
+            prompt: 用户提示词
+
+        Returns:
+            SHA-256 十六进制摘要
+        """
+        raw = f"{model}\x00{system_prompt}\x00{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, max_age: Optional[int] = None) -> Optional[str]:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+            max_age: 最大有效期（秒），默认使用初始化时的 ttl
+
+        Returns:
+            缓存的响应内容，未命中或已过期返回 None
+        """
+        max_age = self.ttl if max_age is None else max_age
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ AI 缓存读取失败: %s", e)
+            return None
+
+        if not row:
+            return None
+        response, created_at = row
+        if max_age > 0 and time.time() - created_at > max_age:
+            return None
+        return response
+
+    def set(self, key: str, response: str, model: str = "") -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            response: 响应内容
+            model: 模型名称
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, model, response, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, model, response, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("⚠️ AI 缓存写入失败: %s", e)
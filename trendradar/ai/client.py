@@ -5,11 +5,61 @@ DeepSeek 官方 API 客户端
 兼容 OpenAI API 格式，调用 DeepSeek V3 模型
 """
 
+import asyncio
 import os
 import json
-from typing import Optional, List, Dict, Any
+import logging
+import random
+import time
+from typing import Optional, List, Dict, Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from trendradar.core.config import parse_multi_account_config
+
+logger = logging.getLogger(__name__)
+
+# orjson 为可选依赖，序列化/解析大段中文内容时明显快于标准库 json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为 UTF-8 JSON 字节串"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    """解析 JSON（bytes 或 str），解析失败抛出 json.JSONDecodeError"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class StreamInterruptedError(Exception):
+    """流式响应未正常结束（请求失败、连接中断或缺少结束标记）"""
+
+
+class _LazyJson:
+    """日志参数包装：仅在日志实际输出时才序列化，避免被过滤的日志产生格式化开销"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        try:
+            return _json_dumps(self.obj).decode("utf-8")
+        except (TypeError, ValueError):
+            return repr(self.obj)
 
 
 class DeepSeekClient:
@@ -18,12 +68,23 @@ class DeepSeekClient:
     DEFAULT_BASE_URL = "https://api.deepseek.com/v1"
     DEFAULT_MODEL = "deepseek-chat"
 
+    # 连接池配置
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
+    # 重试配置：限流和服务端临时错误自动重试
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRY_DELAY = 60.0
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         timeout: int = 300,
+        max_retries: int = 4,
+        backoff_factor: float = 1.0,
+        api_keys: Optional[List[str]] = None,
     ):
         """
         初始化客户端
@@ -33,20 +94,133 @@ class DeepSeekClient:
             base_url: API 基础 URL
             model: 模型名称
             timeout: 请求超时时间（秒）
+            max_retries: 限流/服务端错误/连接失败时的最大重试次数
+            backoff_factor: 指数退避基数（秒），第 n 次重试约等待 backoff_factor * 2^(n-1) 秒
+            api_keys: 额外的 API 密钥列表（多账号），默认从环境变量 DEEPSEEK_API_KEYS
+                获取（";" 分隔），批量请求时轮流使用
         """
-        self.api_key = api_key or os.environ.get("DEEPSEEK_API_KEY", "")
+        primary_key = api_key or os.environ.get("DEEPSEEK_API_KEY", "")
+        if api_keys is None:
+            api_keys = parse_multi_account_config(os.environ.get("DEEPSEEK_API_KEYS", ""))
+        keys = [primary_key] + list(api_keys)
+        # 去重并保持顺序，主密钥排在首位
+        self.api_keys = [key for key in dict.fromkeys(keys) if key]
+        self.api_key = self.api_keys[0] if self.api_keys else ""
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.model = model or os.environ.get("DEEPSEEK_MODEL", self.DEFAULT_MODEL)
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # 复用连接（keep-alive），避免每次请求重新进行 TCP/TLS 握手
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
 
         if not self.api_key:
-            print("⚠️ 警告: 未配置 DEEPSEEK_API_KEY，AI 总结功能将不可用")
+            logger.warning("⚠️ 警告: 未配置 DEEPSEEK_API_KEY，AI 总结功能将不可用")
+
+    def _post(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        stream: bool = False,
+        api_key: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        发送 POST 请求，遇到限流、服务端临时错误或连接失败时按指数退避 + 抖动重试
+
+        读超时不重试：生成耗时较长，重试只会成倍增加等待时间
+
+        Args:
+            url: 请求地址
+            payload: 请求体
+            stream: 是否以流式方式读取响应
+            api_key: 本次请求使用的 API 密钥，默认使用会话中的主密钥
+
+        Returns:
+            最后一次请求的响应（可能仍为错误状态码）
+
+        Raises:
+            requests.exceptions.RequestException: 重试耗尽后仍连接失败，或发生其他请求异常
+        """
+        headers = None
+        if api_key and api_key != self.api_key:
+            headers = {"Authorization": f"Bearer {api_key}"}
+        # 重试时复用同一份序列化结果
+        body = _json_dumps(payload)
+        attempt = 0
+        while True:
+            try:
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except requests.exceptions.ConnectionError:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                retry_after = self._parse_retry_after(response)
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                response.close()
+
+            attempt += 1
+            logger.warning("⚠️ AI API 请求重试 %d/%d，等待 %.2fs", attempt, self.max_retries, delay)
+            time.sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """计算第 attempt 次失败后的等待时间（指数退避 + 随机抖动）"""
+        delay = self.backoff_factor * (2 ** attempt) + random.uniform(0, self.backoff_factor)
+        return min(delay, self.MAX_RETRY_DELAY)
+
+    def _parse_retry_after(self, response: requests.Response) -> Optional[float]:
+        """
+        解析服务端建议的重试等待时间
+
+        优先读取 Retry-After 响应头，其次读取 JSON 响应体中的 retry_after 字段
+        """
+        header = response.headers.get("Retry-After")
+        candidates = [header]
+        if not header:
+            try:
+                result = _json_loads(response.content)
+            except ValueError:
+                result = None
+            if isinstance(result, dict):
+                error = result.get("error")
+                candidates.append(result.get("retry_after"))
+                if isinstance(error, dict):
+                    candidates.append(error.get("retry_after"))
+
+        for value in candidates:
+            try:
+                seconds = float(value)
+            except (TypeError, ValueError):
+                continue
+            if seconds >= 0:
+                return min(seconds, self.MAX_RETRY_DELAY)
+        return None
 
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        api_key: Optional[str] = None,
         **kwargs,
     ) -> Optional[str]:
         """
@@ -56,6 +230,7 @@ class DeepSeekClient:
             messages: 消息列表，格式 [{"role": "user", "content": "..."}]
             temperature: 温度参数，控制随机性
             max_tokens: 最大生成 token 数
+            api_key: 本次请求使用的 API 密钥（可选），默认使用主密钥
             **kwargs: 其他参数
 
         Returns:
@@ -65,10 +240,6 @@ class DeepSeekClient:
             return None
 
         url = f"{self.base_url}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
 
         payload = {
             "model": self.model,
@@ -79,31 +250,168 @@ class DeepSeekClient:
         }
 
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout,
-            )
+            response = self._post(url, payload, api_key=api_key)
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"]
             else:
-                print(f"⚠️ AI API 返回格式异常: {result}")
+                logger.warning("⚠️ AI API 返回格式异常: %s", _LazyJson(result))
                 return None
 
         except requests.exceptions.Timeout:
-            print(f"⚠️ AI API 请求超时 ({self.timeout}s)")
+            logger.warning("⚠️ AI API 请求超时 (%ss)", self.timeout)
             return None
         except requests.exceptions.RequestException as e:
-            print(f"⚠️ AI API 请求失败: {e}")
+            logger.warning("⚠️ AI API 请求失败: %s", e)
             return None
         except json.JSONDecodeError as e:
-            print(f"⚠️ AI API 返回解析失败: {e}")
+            logger.warning("⚠️ AI API 返回解析失败: %s", e)
             return None
 
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        api_key: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        以流式（SSE）方式调用聊天补全 API
+
+        Args:
+            messages: 消息列表，格式 [{"role": "user", "content": "..."}]
+            temperature: 温度参数，控制随机性
+            max_tokens: 最大生成 token 数
+            api_key: 本次请求使用的 API 密钥（可选），默认使用主密钥
+            **kwargs: 其他参数
+
+        Yields:
+            逐段生成的文本内容
+
+        Raises:
+            StreamInterruptedError: 请求失败、中途断开，或未收到 [DONE] / finish_reason 结束标记。
+                此时已产出的内容不完整，调用方不应将其作为最终结果
+        """
+        if not self.api_key:
+            return
+
+        url = f"{self.base_url}/chat/completions"
+
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            **kwargs,
+            "stream": True,
+        }
+
+        # 收到 [DONE] 或 finish_reason 才视为正常结束
+        completed = False
+        try:
+            with self._post(url, payload, stream=True, api_key=api_key) as response:
+                response.raise_for_status()
+
+                # 按字节读取：SSE 响应通常不带 charset，交给 JSON 解析器按 UTF-8 处理
+                for line in response.iter_lines():
+                    # SSE 格式：每个事件以 "data: " 开头，空行为分隔
+                    if not line or not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        completed = True
+                        break
+
+                    chunk = _json_loads(data)
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+                    content = (choices[0].get("delta") or {}).get("content")
+                    if content:
+                        yield content
+                    if choices[0].get("finish_reason"):
+                        completed = True
+
+        except requests.exceptions.Timeout as e:
+            logger.warning("⚠️ AI API 请求超时 (%ss)", self.timeout)
+            raise StreamInterruptedError(f"请求超时 ({self.timeout}s)") from e
+        except requests.exceptions.RequestException as e:
+            logger.warning("⚠️ AI API 请求失败: %s", e)
+            raise StreamInterruptedError(f"请求失败: {e}") from e
+        except json.JSONDecodeError as e:
+            logger.warning("⚠️ AI API 返回解析失败: %s", e)
+            raise StreamInterruptedError(f"返回解析失败: {e}") from e
+
+        if not completed:
+            logger.warning("⚠️ AI API 流式响应未正常结束（缺少结束标记）")
+            raise StreamInterruptedError("流式响应未收到结束标记")
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        api_key: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        异步调用聊天补全 API
+
+        在线程池中执行同步请求，多个调用可并发进行，互不阻塞
+
+        Args:
+            messages: 消息列表，格式 [{"role": "user", "content": "..."}]
+            temperature: 温度参数，控制随机性
+            max_tokens: 最大生成 token 数
+            api_key: 本次请求使用的 API 密钥（可选），默认使用主密钥
+            **kwargs: 其他参数
+
+        Returns:
+            生成的文本内容，失败返回 None
+        """
+        return await asyncio.to_thread(
+            self.chat_completion,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=api_key,
+            **kwargs,
+        )
+
+    async def achat_batch(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> List[Optional[str]]:
+        """
+        并发执行多组对话请求
+
+        配置了多个 API 密钥时，按轮询方式为各请求分配密钥，分摊限流配额
+
+        Args:
+            messages_list: 多组消息列表，每组对应一次独立请求
+            max_concurrency: 最大并发请求数
+            **kwargs: 传递给 achat_completion 的其他参数
+
+        Returns:
+            与输入顺序一致的结果列表，失败项为 None
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        keys = self.api_keys or [None]
+
+        async def _run(index: int, messages: List[Dict[str, str]]) -> Optional[str]:
+            async with semaphore:
+                return await self.achat_completion(
+                    messages, api_key=keys[index % len(keys)], **kwargs
+                )
+
+        return await asyncio.gather(*(_run(i, m) for i, m in enumerate(messages_list)))
+
     def simple_chat(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
         """
         简单对话接口
@@ -115,13 +423,52 @@ class DeepSeekClient:
         Returns:
             AI 回复内容
         """
+        return self.chat_completion(self.build_messages(prompt, system_prompt))
+
+    def stream_chat(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        简单流式对话接口
+
+        Args:
+            prompt: 用户提问
+            system_prompt: 系统提示词
+
+        Yields:
+            逐段生成的 AI 回复内容
+
+        Raises:
+            StreamInterruptedError: 流式响应未正常结束
+        """
+        return self.stream_chat_completion(self.build_messages(prompt, system_prompt))
+
+    @staticmethod
+    def build_messages(prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        构建对话消息列表
+
+        Args:
+            prompt: 用户提问
+            system_prompt: 系统提示词
+
+        Returns:
+            消息列表
+        """
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
-
-        return self.chat_completion(messages)
+        return messages
 
     def is_available(self) -> bool:
         """检查 API 是否可用"""
         return bool(self.api_key)
+
+    def close(self) -> None:
+        """关闭会话，释放连接池"""
+        self._session.close()
+
+    def __enter__(self) -> "DeepSeekClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -5,34 +5,64 @@
 使用 AI 模型对热点新闻进行智能总结
 """
 
-from typing import List, Dict, Optional
+import asyncio
+import io
+import logging
+import re
+from typing import Callable, List, Dict, Optional
 
-from trendradar.ai.client import DeepSeekClient
+from trendradar.ai.cache import ResponseCache
+from trendradar.ai.client import DeepSeekClient, StreamInterruptedError
+
+logger = logging.getLogger(__name__)
+
+# 新闻内容格式模板（每行自带换行符）
+_KEYWORD_FORMAT = "【{word}】\n"
+_NEWS_WITH_URL_FORMAT = "- {title} ({source}) [链接]({url})\n"
+_NEWS_FORMAT = "- {title} ({source})\n"
+
+# 分块总结时每块结果前的小标题
+_CHUNK_HEADER_FORMAT = "📌 **第 {index}/{total} 部分：{words}**\n\n"
+
+# 标题去重：去除标点、空白后取前若干字符作为签名，近似相同的标题视为同一条新闻
+_TITLE_NOISE_RE = re.compile(r"[\W_]+")
+_TITLE_SIGNATURE_LENGTH = 32
+
+
+def _title_signature(title: str) -> str:
+    """计算标题去重签名"""
+    signature = _TITLE_NOISE_RE.sub("", title.lower())[:_TITLE_SIGNATURE_LENGTH]
+    # 纯符号标题没有有效签名，直接使用原标题
+    return signature or title
 
 
 class NewsSummarizer:
     """新闻总结器"""
 
-    # 系统提示词
-    SYSTEM_PROMPT = """你是一个专业的新闻摘要助手。你的任务是将热点新闻列表总结成简洁、有洞察力的摘要。
-
-要求：
-1. 按主题分类整理新闻，使用 emoji 标记不同类别
-2. 每个类别下列出 2-3 条最重要的新闻要点
-3. 对热点事件进行简短评论或背景补充
-4. 语言简洁有力，突出重点
-5. 总字数控制在 500 字以内
-6. 使用 Markdown 格式输出
-7. **重要：必须保留原文中的具体名称**，包括但不限于：
-   - 公司全称或简称（如：航天宏图、比亚迪、宁德时代）
-   - 股票代码（如：688066、300750）
-   - 人物姓名
-   - 具体金额、数据
-   - 不要用"某公司"、"某股票"等模糊表述替代具体名称
-8. **重要：必须在每条新闻要点后附上来源链接**，使用 Markdown 链接格式 [来源](url)。如果多条相似新闻被合并，只保留一个最具代表性的来源链接即可
-
-输出格式示例：
-🔥 **科技热点**
+    # 系统提示词（保持精简，格式要求通过下方示例对话给出）
+    SYSTEM_PROMPT = """你是新闻摘要助手，将热点新闻列表总结为简洁、有洞察力的 Markdown 摘要：按主题分类并用 emoji 标记，每类列出 2-3 条要点，可附简短评论或背景。
+必须遵守：
+1. 保留原文中的具体名称（公司、股票代码、人名、金额数据），不得用"某公司"等模糊表述替代
+2. 每条要点后附来源链接 [来源](url)，相似新闻合并时只保留一个最具代表性的链接
+3. 总字数不超过 500 字"""
+
+    # 示例对话（one-shot）：与系统提示词一起构成固定前缀，可命中服务端的上下文缓存
+    EXAMPLE_USER = """请总结以下热点新闻：
+
+【华为】
+- 华为发布新产品，引发市场关注 (新浪财经) [链接](https://example.com/news1)
+
+【AI】
+- OpenAI 在 AI 技术上取得突破性进展 (36氪) [链接](https://example.com/news2)
+
+【航天宏图】
+- 航天宏图(688066)因信披违规被立案调查 (同花顺) [链接](https://example.com/news3)
+
+【政策】
+- 重大政策解读 (央视新闻) [链接](https://example.com/news4)
+"""
+
+    EXAMPLE_ASSISTANT = """🔥 **科技热点**
 • 华为发布新产品，引发市场关注... [新浪财经](https://example.com/news1)
 • OpenAI 在 AI 技术上取得突破性进展... [36氪](https://example.com/news2)
 
@@ -48,6 +78,8 @@ class NewsSummarizer:
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        api_keys: Optional[List[str]] = None,
     ):
         """
         初始化总结器
@@ -55,13 +87,17 @@ class NewsSummarizer:
         Args:
             api_key: API 密钥
             model: 模型名称
+            cache: 响应缓存（可选），相同输入直接复用上次结果
+            api_keys: 额外的 API 密钥列表（多账号），用于并行总结
         """
-        self.client = DeepSeekClient(api_key=api_key, model=model)
+        self.client = DeepSeekClient(api_key=api_key, model=model, api_keys=api_keys)
+        self.cache = cache
 
     def summarize_news(
         self,
         stats: List[Dict],
         max_news: int = 50,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Optional[str]:
         """
         总结热点新闻
@@ -69,85 +105,304 @@ class NewsSummarizer:
         Args:
             stats: 统计数据列表，包含热点词汇和对应新闻
             max_news: 最大处理新闻数
+            on_token: 流式回调（可选），提供时以流式方式调用 API，
+                每收到一段内容即回调一次；流中途中断时已回调的内容不完整，
+                本方法返回 None 且不写入缓存
 
         Returns:
             AI 生成的总结内容，失败返回 None
         """
         if not self.client.is_available():
-            print("⚠️ AI 服务不可用，跳过新闻总结")
+            logger.warning("⚠️ AI 服务不可用，跳过新闻总结")
             return None
 
         # 构建新闻内容
         news_content = self._build_news_content(stats, max_news)
         if not news_content:
-            print("⚠️ 没有新闻内容需要总结")
+            logger.warning("⚠️ 没有新闻内容需要总结")
             return None
 
-        # 构建提示词
-        prompt = f"""请总结以下热点新闻：
+        prompt = self._build_prompt(news_content)
+
+        cached = self._get_cached(prompt)
+        if cached:
+            logger.info("♻️ 命中 AI 总结缓存，复用 %d 字符", len(cached))
+            if on_token is not None:
+                on_token(cached)
+            return cached
+
+        logger.info("🤖 正在调用 AI 总结 %d 字符的新闻内容...", len(news_content))
+
+        if on_token is not None:
+            parts = []
+            try:
+                for token in self.client.stream_chat_completion(self._build_messages(prompt)):
+                    parts.append(token)
+                    on_token(token)
+                result = "".join(parts) or None
+            except StreamInterruptedError:
+                # 不完整的总结既不返回也不缓存
+                result = None
+        else:
+            result = self.client.chat_completion(self._build_messages(prompt))
 
-{news_content}
+        if result:
+            logger.info("✅ AI 总结完成，生成 %d 字符", len(result))
+            self._set_cached(prompt, result)
+        else:
+            logger.warning("⚠️ AI 总结失败")
 
-请按照系统提示的格式输出总结。"""
+        return result
 
-        print(f"🤖 正在调用 AI 总结 {len(news_content)} 字符的新闻内容...")
+    def summarize_news_batch(
+        self,
+        stats_groups: List[List[Dict]],
+        max_news: int = 50,
+        max_concurrency: int = 8,
+    ) -> List[Optional[str]]:
+        """
+        并发总结多组热点新闻
 
-        result = self.client.simple_chat(prompt, self.SYSTEM_PROMPT)
+        每组统计数据独立生成一个总结，各请求并发发送
 
-        if result:
-            print(f"✅ AI 总结完成，生成 {len(result)} 字符")
-        else:
-            print("⚠️ AI 总结失败")
+        Args:
+            stats_groups: 多组统计数据列表
+            max_news: 每组最大处理新闻数
+            max_concurrency: 最大并发请求数
 
-        return result
+        Returns:
+            与输入顺序一致的总结列表，失败或无内容的组为 None
+        """
+        if not self.client.is_available():
+            logger.warning("⚠️ AI 服务不可用，跳过新闻总结")
+            return [None] * len(stats_groups)
+
+        if len(stats_groups) <= 1:
+            return [self.summarize_news(stats, max_news) for stats in stats_groups]
+
+        # 只为有内容且未命中缓存的组发起请求，保留原始位置
+        results: List[Optional[str]] = [None] * len(stats_groups)
+        indexed_prompts = []
+        for index, stats in enumerate(stats_groups):
+            news_content = self._build_news_content(stats, max_news)
+            if not news_content:
+                continue
+            prompt = self._build_prompt(news_content)
+            cached = self._get_cached(prompt)
+            if cached:
+                results[index] = cached
+            else:
+                indexed_prompts.append((index, prompt))
+
+        if not indexed_prompts:
+            if not any(results):
+                logger.warning("⚠️ 没有新闻内容需要总结")
+            return results
+
+        logger.info("🤖 正在并发调用 AI 总结 %d 组新闻内容...", len(indexed_prompts))
+
+        outputs = asyncio.run(
+            self.client.achat_batch(
+                [self._build_messages(prompt) for _, prompt in indexed_prompts],
+                max_concurrency=max_concurrency,
+            )
+        )
+        for (index, prompt), output in zip(indexed_prompts, outputs):
+            results[index] = output
+            if output:
+                self._set_cached(prompt, output)
+
+        success_count = sum(1 for output in outputs if output)
+        logger.info("✅ AI 批量总结完成，成功 %d/%d 组", success_count, len(outputs))
+
+        return results
+
+    def summarize_news_parallel(
+        self,
+        stats: List[Dict],
+        chunk_size: int = 10,
+        max_news: int = 50,
+    ) -> Optional[str]:
+        """
+        分块并行总结热点新闻
 
-    def _build_news_content(self, stats: List[Dict], max_news: int) -> str:
+        先对全部统计数据统一去重并截取 max_news 条新闻，再将保留下来的关键词组
+        切分为若干块，各块并发请求（多个 API 密钥时轮流使用），
+        结果按原顺序拼接，每块前附带标注所含关键词的小标题
+
+        Args:
+            stats: 统计数据列表，包含热点词汇和对应新闻
+            chunk_size: 每块包含的关键词组数
+            max_news: 所有块合计的最大处理新闻数
+
+        Returns:
+            拼接后的总结内容，全部失败返回 None
         """
-        构建新闻内容文本
+        selected = self._select_news(stats, max_news)
+        chunk_size = max(1, chunk_size)
+        chunks = [selected[i:i + chunk_size] for i in range(0, len(selected), chunk_size)]
+        if len(chunks) <= 1:
+            return self.summarize_news(selected, max_news)
+
+        # 各块已是去重、截取后的结果，再次构建内容时不会被进一步裁剪
+        results = self.summarize_news_batch(
+            chunks,
+            max_news=max_news,
+            max_concurrency=len(chunks),
+        )
+        sections = []
+        for index, (chunk, result) in enumerate(zip(chunks, results), 1):
+            if not result:
+                continue
+            words = "、".join(stat["word"] for stat in chunk)
+            sections.append(
+                _CHUNK_HEADER_FORMAT.format(index=index, total=len(chunks), words=words) + result
+            )
+        if not sections:
+            return None
+        return "\n\n".join(sections)
+
+    def _cache_key(self, prompt: str) -> str:
+        """生成当前模型 + 提示词对应的缓存键"""
+        prefix = "\x00".join((self.SYSTEM_PROMPT, self.EXAMPLE_USER, self.EXAMPLE_ASSISTANT))
+        return ResponseCache.make_key(self.client.model, prefix, prompt)
+
+    def _get_cached(self, prompt: str) -> Optional[str]:
+        """读取缓存的总结结果，未启用缓存或未命中返回 None"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(prompt))
+
+    def _set_cached(self, prompt: str, result: str) -> None:
+        """写入总结结果到缓存"""
+        if self.cache is not None:
+            self.cache.set(self._cache_key(prompt), result, model=self.client.model)
+
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        构建对话消息列表：固定前缀（系统提示词 + 示例对话）在前，本次请求在后
+
+        Args:
+            prompt: 用户提示词
+
+        Returns:
+            消息列表
+        """
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": self.EXAMPLE_USER},
+            {"role": "assistant", "content": self.EXAMPLE_ASSISTANT},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _build_prompt(self, news_content: str) -> str:
+        """
+        构建用户提示词
+
+        Args:
+            news_content: 格式化的新闻文本
+
+        Returns:
+            用户提示词
+        """
+        return f"""请总结以下热点新闻：
+
+{news_content}
+
+请按照示例的格式输出总结。"""
+
+    def _select_news(self, stats: List[Dict], max_news: int) -> List[Dict]:
+        """
+        筛选需要发送给模型的新闻
+
+        同一新闻常被多个关键词命中，跨关键词按标题签名去重，
+        只在首次出现的关键词下保留，减少发送给模型的重复内容；
+        合计最多保留 max_news 条，没有可保留新闻的关键词组被丢弃
 
         Args:
             stats: 统计数据列表
             max_news: 最大新闻数
 
         Returns:
-            格式化的新闻文本
+            筛选后的统计数据列表，每项为 {"word": 关键词, "titles": 保留的新闻列表}
         """
-        lines = []
+        selected = []
+        if max_news <= 0:
+            return selected
+
         news_count = 0
+        seen_signatures = set()
 
         for stat in stats:
-            if news_count >= max_news:
-                break
-
-            word = stat.get("word", "")
-            titles = stat.get("titles", [])
-
+            titles = stat.get("titles")
             if not titles:
                 continue
 
-            # 添加关键词标题
-            lines.append(f"【{word}】")
-
+            kept = []
             for title_data in titles:
+                title = title_data.get("title")
+                if not title:
+                    continue
+
+                signature = _title_signature(title)
+                if signature in seen_signatures:
+                    continue
+                seen_signatures.add(signature)
+
+                kept.append(title_data)
+                news_count += 1
                 if news_count >= max_news:
                     break
 
-                title = title_data.get("title", "")
+            if kept:
+                selected.append({"word": stat.get("word", ""), "titles": kept})
+
+            if news_count >= max_news:
+                break
+
+        return selected
+
+    def _build_news_content(self, stats: List[Dict], max_news: int) -> str:
+        """
+        构建新闻内容文本
+
+        Args:
+            stats: 统计数据列表
+            max_news: 最大新闻数
+
+        Returns:
+            格式化的新闻文本（经 _select_news 去重、截取）
+        """
+        selected = self._select_news(stats, max_news)
+        if not selected:
+            return ""
+
+        buf = io.StringIO()
+        write = buf.write
+
+        for stat in selected:
+            write(_KEYWORD_FORMAT.format(word=stat["word"]))
+
+            for title_data in stat["titles"]:
+                title = title_data["title"]
                 source = title_data.get("source_name", "")
                 # 优先使用 mobile_url，其次使用 url
-                url = title_data.get("mobile_url") or title_data.get("url", "")
+                url = title_data.get("mobile_url") or title_data.get("url") or ""
 
-                if title:
-                    if url:
-                        lines.append(f"- {title} ({source}) [链接]({url})")
-                    else:
-                        lines.append(f"- {title} ({source})")
-                    news_count += 1
+                if url:
+                    write(_NEWS_WITH_URL_FORMAT.format(title=title, source=source, url=url))
+                else:
+                    write(_NEWS_FORMAT.format(title=title, source=source))
 
-            lines.append("")  # 空行分隔
+            write("\n")  # 空行分隔
 
-        return "\n".join(lines)
+        # 每个关键词块以空行结尾，去掉最后一个换行，与逐行拼接的格式保持一致
+        return buf.getvalue()[:-1]
 
     def is_available(self) -> bool:
         """检查总结服务是否可用"""
         return self.client.is_available()
+
+    def close(self) -> None:
+        """释放底层客户端资源"""
+        self.client.close()
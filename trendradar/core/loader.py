@@ -6,15 +6,25 @@
 支持从 .env 文件加载本地开发配置。
 """
 
+import ast
+import copy
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
-
-import yaml
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 
 from .config import parse_multi_account_config, validate_paired_configs
 
 
+# .env 单行格式: KEY=VALUE，VALUE 可用单/双引号包裹；以 # 开头的行为注释
+# （[^\S\n] 表示不含换行的空白字符，保证匹配不跨行）
+_DOTENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*"
+    r"(?:\"(.*)\"|'(.*)'|[\"']()|(.*?))[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
 def _load_dotenv(env_path: str = ".env") -> bool:
     """
     加载 .env 文件到环境变量（简易实现，无需 python-dotenv 依赖）
@@ -31,25 +41,16 @@ def _load_dotenv(env_path: str = ".env") -> bool:
 
     loaded_count = 0
     try:
-        with open(env_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # 跳过空行和注释
-                if not line or line.startswith("#"):
-                    continue
-                # 解析 KEY=VALUE 格式
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    key = key.strip()
-                    value = value.strip()
-                    # 移除引号
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    # 只有环境变量未设置时才加载
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-                        loaded_count += 1
+        text = env_file.read_text(encoding="utf-8")
+        for match in _DOTENV_LINE_RE.finditer(text):
+            key = match.group(1)
+            # 取值分组中只有一个参与匹配，lastindex 即为该分组
+            # （单个引号的值与旧实现一致，按空字符串处理）
+            value = match.group(match.lastindex)
+            # 只有环境变量未设置时才加载
+            if key not in os.environ:
+                os.environ[key] = value
+                loaded_count += 1
         if loaded_count > 0:
             print(f"📄 从 .env 文件加载了 {loaded_count} 个环境变量")
         return True
@@ -62,243 +63,369 @@ def _load_dotenv(env_path: str = ".env") -> bool:
 _load_dotenv()
 
 
-def _get_env_bool(key: str, default: bool = False) -> Optional[bool]:
-    """从环境变量获取布尔值，如果未设置返回 None"""
-    value = os.environ.get(key, "").strip().lower()
-    if not value:
-        return None
-    return value in ("true", "1")
-
-
-def _get_env_int(key: str, default: int = 0) -> int:
-    """从环境变量获取整数值"""
-    value = os.environ.get(key, "").strip()
-    if not value:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
-
-
-def _get_env_str(key: str, default: str = "") -> str:
-    """从环境变量获取字符串值"""
-    return os.environ.get(key, "").strip() or default
+# 已解析的 YAML 配置缓存，键为 (路径, 修改时间)，文件变更后自动失效
+_YAML_CACHE: Dict[Tuple[str, int], Any] = {}
 
 
-def _load_app_config(config_data: Dict) -> Dict:
-    """加载应用配置"""
-    app_config = config_data.get("app", {})
-    return {
-        "VERSION_CHECK_URL": app_config.get("version_check_url", ""),
-        "SHOW_VERSION_UPDATE": app_config.get("show_version_update", True),
-        "TIMEZONE": _get_env_str("TIMEZONE") or app_config.get("timezone", "Asia/Shanghai"),
-    }
-
+def _read_yaml_config(config_path: str) -> Any:
+    """
+    读取并解析 YAML 配置文件（带缓存）
 
-def _load_crawler_config(config_data: Dict) -> Dict:
-    """加载爬虫配置"""
-    crawler_config = config_data.get("crawler", {})
-    enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
-    return {
-        "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
-        "USE_PROXY": crawler_config.get("use_proxy", False),
-        "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
-        "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enable_crawler", True),
-    }
+    Args:
+        config_path: 配置文件路径
 
+    Returns:
+        解析后的配置数据副本
+    """
+    path = Path(config_path).resolve()
+    key = (str(path), path.stat().st_mtime_ns)
 
-def _load_report_config(config_data: Dict) -> Dict:
-    """加载报告配置"""
-    report_config = config_data.get("report", {})
+    if key not in _YAML_CACHE:
+        # 仅在实际解析时导入 yaml，缩短启动时间
+        import yaml
 
-    # 环境变量覆盖
-    sort_by_position_env = _get_env_bool("SORT_BY_POSITION_FIRST")
-    reverse_content_env = _get_env_bool("REVERSE_CONTENT_ORDER")
-    max_news_env = _get_env_int("MAX_NEWS_PER_KEYWORD")
+        # 优先使用 C 实现的 YAML 解析器（libyaml），不可用时回退到纯 Python 实现
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r", encoding="utf-8") as f:
+            config_data = yaml.load(f, Loader=loader)
+        # 同一路径只保留最新版本
+        for stale_key in [k for k in _YAML_CACHE if k[0] == key[0]]:
+            del _YAML_CACHE[stale_key]
+        _YAML_CACHE[key] = config_data
 
-    return {
-        "REPORT_MODE": _get_env_str("REPORT_MODE") or report_config.get("mode", "daily"),
-        "RANK_THRESHOLD": report_config.get("rank_threshold", 10),
-        "SORT_BY_POSITION_FIRST": sort_by_position_env if sort_by_position_env is not None else report_config.get("sort_by_position_first", False),
-        "MAX_NEWS_PER_KEYWORD": max_news_env or report_config.get("max_news_per_keyword", 0),
-        "REVERSE_CONTENT_ORDER": reverse_content_env if reverse_content_env is not None else report_config.get("reverse_content_order", False),
-    }
+    # 返回副本，防止调用方修改缓存内容
+    return copy.deepcopy(_YAML_CACHE[key])
 
 
-def _load_notification_config(config_data: Dict) -> Dict:
-    """加载通知配置"""
-    notification = config_data.get("notification", {})
-    enable_notification_env = _get_env_bool("ENABLE_NOTIFICATION")
-
-    return {
-        "ENABLE_NOTIFICATION": enable_notification_env if enable_notification_env is not None else notification.get("enable_notification", True),
-        "MESSAGE_BATCH_SIZE": notification.get("message_batch_size", 4000),
-        "DINGTALK_BATCH_SIZE": notification.get("dingtalk_batch_size", 20000),
-        "FEISHU_BATCH_SIZE": notification.get("feishu_batch_size", 29000),
-        "BARK_BATCH_SIZE": notification.get("bark_batch_size", 3600),
-        "SLACK_BATCH_SIZE": notification.get("slack_batch_size", 4000),
-        "BATCH_SEND_INTERVAL": notification.get("batch_send_interval", 1.0),
-        "FEISHU_MESSAGE_SEPARATOR": notification.get("feishu_message_separator", "---"),
-        "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or notification.get("max_accounts_per_channel", 3),
-    }
+# 环境变量中视为 True 的取值
+_TRUE_VALUES = frozenset(("true", "1"))
 
+# 字段定义: (输出键, YAML 路径, 环境变量名, 默认值, 类型)
+# - 输出键和 YAML 路径使用 "." 表示嵌套层级
+# - 环境变量名为 None 时只从配置文件读取
+# - 类型为 str/bool/int，决定环境变量的解析方式
+_ConfigField = Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str], Any, type]
 
-def _load_push_window_config(config_data: Dict) -> Dict:
-    """加载推送窗口配置"""
-    notification = config_data.get("notification", {})
-    push_window = notification.get("push_window", {})
-    time_range = push_window.get("time_range", {})
 
-    enabled_env = _get_env_bool("PUSH_WINDOW_ENABLED")
-    once_per_day_env = _get_env_bool("PUSH_WINDOW_ONCE_PER_DAY")
+def _fields(*specs: Tuple[str, str, Optional[str], Any, type]) -> Tuple[_ConfigField, ...]:
+    """预先拆分字段定义中的路径，避免每次加载时重复解析"""
+    return tuple(
+        (tuple(output_key.split(".")), tuple(yaml_path.split(".")), env_key, default, kind)
+        for output_key, yaml_path, env_key, default, kind in specs
+    )
 
-    return {
-        "ENABLED": enabled_env if enabled_env is not None else push_window.get("enabled", False),
-        "TIME_RANGE": {
-            "START": _get_env_str("PUSH_WINDOW_START") or time_range.get("start", "08:00"),
-            "END": _get_env_str("PUSH_WINDOW_END") or time_range.get("end", "22:00"),
-        },
-        "ONCE_PER_DAY": once_per_day_env if once_per_day_env is not None else push_window.get("once_per_day", True),
-    }
 
+def _parse_env_int(raw: str) -> int:
+    """解析环境变量中的整数，空值或非法值返回 0（由调用方回退到配置文件的值）"""
+    if not raw:
+        return 0
+    try:
+        return int(raw)
+    except ValueError:
+        return 0
+
+
+_APP_FIELDS = _fields(
+    ("VERSION_CHECK_URL", "app.version_check_url", None, "", str),
+    ("SHOW_VERSION_UPDATE", "app.show_version_update", None, True, bool),
+    ("TIMEZONE", "app.timezone", "TIMEZONE", "Asia/Shanghai", str),
+)
+
+_CRAWLER_FIELDS = _fields(
+    ("REQUEST_INTERVAL", "crawler.request_interval", None, 100, int),
+    ("USE_PROXY", "crawler.use_proxy", None, False, bool),
+    ("DEFAULT_PROXY", "crawler.default_proxy", None, "", str),
+    ("ENABLE_CRAWLER", "crawler.enable_crawler", "ENABLE_CRAWLER", True, bool),
+)
+
+_REPORT_FIELDS = _fields(
+    ("REPORT_MODE", "report.mode", "REPORT_MODE", "daily", str),
+    ("RANK_THRESHOLD", "report.rank_threshold", None, 10, int),
+    ("SORT_BY_POSITION_FIRST", "report.sort_by_position_first", "SORT_BY_POSITION_FIRST", False, bool),
+    ("MAX_NEWS_PER_KEYWORD", "report.max_news_per_keyword", "MAX_NEWS_PER_KEYWORD", 0, int),
+    ("REVERSE_CONTENT_ORDER", "report.reverse_content_order", "REVERSE_CONTENT_ORDER", False, bool),
+)
+
+_NOTIFICATION_FIELDS = _fields(
+    ("ENABLE_NOTIFICATION", "notification.enable_notification", "ENABLE_NOTIFICATION", True, bool),
+    ("MESSAGE_BATCH_SIZE", "notification.message_batch_size", None, 4000, int),
+    ("DINGTALK_BATCH_SIZE", "notification.dingtalk_batch_size", None, 20000, int),
+    ("FEISHU_BATCH_SIZE", "notification.feishu_batch_size", None, 29000, int),
+    ("BARK_BATCH_SIZE", "notification.bark_batch_size", None, 3600, int),
+    ("SLACK_BATCH_SIZE", "notification.slack_batch_size", None, 4000, int),
+    ("BATCH_SEND_INTERVAL", "notification.batch_send_interval", None, 1.0, float),
+    ("FEISHU_MESSAGE_SEPARATOR", "notification.feishu_message_separator", None, "---", str),
+    ("MAX_ACCOUNTS_PER_CHANNEL", "notification.max_accounts_per_channel", "MAX_ACCOUNTS_PER_CHANNEL", 3, int),
+)
+
+_PUSH_WINDOW_FIELDS = _fields(
+    ("ENABLED", "notification.push_window.enabled", "PUSH_WINDOW_ENABLED", False, bool),
+    ("TIME_RANGE.START", "notification.push_window.time_range.start", "PUSH_WINDOW_START", "08:00", str),
+    ("TIME_RANGE.END", "notification.push_window.time_range.end", "PUSH_WINDOW_END", "22:00", str),
+    ("ONCE_PER_DAY", "notification.push_window.once_per_day", "PUSH_WINDOW_ONCE_PER_DAY", True, bool),
+)
+
+_WEIGHT_FIELDS = _fields(
+    ("RANK_WEIGHT", "weight.rank_weight", None, 1.0, float),
+    ("FREQUENCY_WEIGHT", "weight.frequency_weight", None, 1.0, float),
+    ("HOTNESS_WEIGHT", "weight.hotness_weight", None, 1.0, float),
+)
+
+_AI_SUMMARY_FIELDS = _fields(
+    ("ENABLED", "ai_summary.enabled", "AI_SUMMARY_ENABLED", True, bool),
+    ("MODEL", "ai_summary.model", "AI_SUMMARY_MODEL", "deepseek-ai/DeepSeek-V3", str),
+    ("BASE_URL", "ai_summary.base_url", "AI_SUMMARY_BASE_URL", "https://api.deepseek.com", str),
+    ("CACHE.ENABLED", "ai_summary.cache.enabled", "ENABLE_AI_CACHE", False, bool),
+    ("CACHE.PATH", "ai_summary.cache.path", "AI_CACHE_PATH", "output/ai_cache.db", str),
+    ("CACHE.TTL", "ai_summary.cache.ttl", "AI_CACHE_TTL", 86400, int),
+)
+
+_STORAGE_FIELDS = _fields(
+    ("BACKEND", "storage.backend", "STORAGE_BACKEND", "auto", str),
+    ("FORMATS.SQLITE", "storage.formats.sqlite", None, True, bool),
+    ("FORMATS.TXT", "storage.formats.txt", "STORAGE_TXT_ENABLED", True, bool),
+    ("FORMATS.HTML", "storage.formats.html", "STORAGE_HTML_ENABLED", True, bool),
+    ("LOCAL.DATA_DIR", "storage.local.data_dir", None, "output", str),
+    ("LOCAL.RETENTION_DAYS", "storage.local.retention_days", "LOCAL_RETENTION_DAYS", 0, int),
+    ("REMOTE.ENDPOINT_URL", "storage.remote.endpoint_url", "S3_ENDPOINT_URL", "", str),
+    ("REMOTE.BUCKET_NAME", "storage.remote.bucket_name", "S3_BUCKET_NAME", "", str),
+    ("REMOTE.ACCESS_KEY_ID", "storage.remote.access_key_id", "S3_ACCESS_KEY_ID", "", str),
+    ("REMOTE.SECRET_ACCESS_KEY", "storage.remote.secret_access_key", "S3_SECRET_ACCESS_KEY", "", str),
+    ("REMOTE.REGION", "storage.remote.region", "S3_REGION", "", str),
+    ("REMOTE.RETENTION_DAYS", "storage.remote.retention_days", "REMOTE_RETENTION_DAYS", 0, int),
+    ("PULL.ENABLED", "storage.pull.enabled", "PULL_ENABLED", False, bool),
+    ("PULL.DAYS", "storage.pull.days", "PULL_DAYS", 7, int),
+)
+
+_WEBHOOK_FIELDS = _fields(
+    # 飞书
+    ("FEISHU_WEBHOOK_URL", "notification.webhooks.feishu_url", "FEISHU_WEBHOOK_URL", "", str),
+    # 钉钉
+    ("DINGTALK_WEBHOOK_URL", "notification.webhooks.dingtalk_url", "DINGTALK_WEBHOOK_URL", "", str),
+    # 企业微信
+    ("WEWORK_WEBHOOK_URL", "notification.webhooks.wework_url", "WEWORK_WEBHOOK_URL", "", str),
+    ("WEWORK_MSG_TYPE", "notification.webhooks.wework_msg_type", "WEWORK_MSG_TYPE", "markdown", str),
+    # Telegram
+    ("TELEGRAM_BOT_TOKEN", "notification.webhooks.telegram_bot_token", "TELEGRAM_BOT_TOKEN", "", str),
+    ("TELEGRAM_CHAT_ID", "notification.webhooks.telegram_chat_id", "TELEGRAM_CHAT_ID", "", str),
+    # 邮件
+    ("EMAIL_FROM", "notification.webhooks.email_from", "EMAIL_FROM", "", str),
+    ("EMAIL_PASSWORD", "notification.webhooks.email_password", "EMAIL_PASSWORD", "", str),
+    ("EMAIL_TO", "notification.webhooks.email_to", "EMAIL_TO", "", str),
+    ("EMAIL_SMTP_SERVER", "notification.webhooks.email_smtp_server", "EMAIL_SMTP_SERVER", "", str),
+    ("EMAIL_SMTP_PORT", "notification.webhooks.email_smtp_port", "EMAIL_SMTP_PORT", "", str),
+    # ntfy（服务器地址为空时使用默认值，见 _FALSY_FALLBACKS）
+    ("NTFY_SERVER_URL", "notification.webhooks.ntfy_server_url", "NTFY_SERVER_URL", "", str),
+    ("NTFY_TOPIC", "notification.webhooks.ntfy_topic", "NTFY_TOPIC", "", str),
+    ("NTFY_TOKEN", "notification.webhooks.ntfy_token", "NTFY_TOKEN", "", str),
+    # Bark
+    ("BARK_URL", "notification.webhooks.bark_url", "BARK_URL", "", str),
+    # Slack
+    ("SLACK_WEBHOOK_URL", "notification.webhooks.slack_webhook_url", "SLACK_WEBHOOK_URL", "", str),
+)
+
+_DEFAULT_NTFY_SERVER_URL = "https://ntfy.sh"
+
+_PLATFORM_FIELDS = _fields(
+    ("PLATFORMS", "platforms", None, [], list),
+)
+
+
+def _nested(prefix: str, fields: Tuple[_ConfigField, ...]) -> Tuple[_ConfigField, ...]:
+    """将字段表挂到指定的输出键下"""
+    return tuple(((prefix,) + field[0],) + field[1:] for field in fields)
+
+
+# 完整配置结构（顺序即输出字典的键顺序）
+_CONFIG_SCHEMA = (
+    _APP_FIELDS
+    + _CRAWLER_FIELDS
+    + _REPORT_FIELDS
+    + _NOTIFICATION_FIELDS
+    + _nested("PUSH_WINDOW", _PUSH_WINDOW_FIELDS)
+    + _nested("WEIGHT_CONFIG", _WEIGHT_FIELDS)
+    + _PLATFORM_FIELDS
+    + _nested("STORAGE", _STORAGE_FIELDS)
+    + _nested("AI_SUMMARY", _AI_SUMMARY_FIELDS)
+    + _WEBHOOK_FIELDS
+)
+
+# 配置文件中的值为空时使用的兜底值（环境变量 > 配置文件 > 兜底值）
+_FALSY_FALLBACKS = {
+    ("NTFY_SERVER_URL",): _DEFAULT_NTFY_SERVER_URL,
+}
+
+
+def _generate_config_reader(schema: Tuple[_ConfigField, ...]) -> str:
+    """
+    根据配置结构生成扁平的配置读取函数源码
 
-def _load_weight_config(config_data: Dict) -> Dict:
-    """加载权重配置"""
-    weight = config_data.get("weight", {})
-    return {
-        "RANK_WEIGHT": weight.get("rank_weight", 1.0),
-        "FREQUENCY_WEIGHT": weight.get("frequency_weight", 1.0),
-        "HOTNESS_WEIGHT": weight.get("hotness_weight", 1.0),
-    }
+    生成的 _read_config(cd, env) 对每个字段只有一个表达式：
+    各 YAML 配置段、各环境变量只读取一次并保存为局部变量，
+    返回值为一次性构造的嵌套字典字面量，无逐段函数调用和中间字典合并
 
+    Args:
+        schema: 字段定义表
 
-def _load_ai_summary_config(config_data: Dict) -> Dict:
-    """加载 AI 总结配置"""
-    ai_summary = config_data.get("ai_summary", {})
-    enabled_env = _get_env_bool("AI_SUMMARY_ENABLED")
+    Returns:
+        Python 源码
+    """
+    prelude: List[str] = []
+    section_vars: Dict[Tuple[str, ...], str] = {(): "cd"}
+    env_vars: Dict[str, str] = {}
+
+    def section_var(path: Tuple[str, ...]) -> str:
+        if path not in section_vars:
+            parent = section_var(path[:-1])
+            name = "s_" + "_".join(re.sub(r"\W", "_", key) for key in path)
+            prelude.append(f"    {name} = {parent}.get({path[-1]!r}, {{}})")
+            section_vars[path] = name
+        return section_vars[path]
+
+    def env_var(key: str) -> str:
+        if key not in env_vars:
+            name = "e_" + re.sub(r"\W", "_", key)
+            prelude.append(f"    {name} = env.get({key!r}, '').strip()")
+            env_vars[key] = name
+        return env_vars[key]
+
+    def literal(value: Any) -> str:
+        source = repr(value)
+        if ast.literal_eval(source) != value:
+            raise ValueError(f"配置默认值无法生成字面量: {value!r}")
+        return source
+
+    # 输出键树，叶子为字段表达式
+    tree: Dict[str, Any] = {}
+    for output_path, yaml_path, env_key, default, kind in schema:
+        expr = f"{section_var(yaml_path[:-1])}.get({yaml_path[-1]!r}, {literal(default)})"
+        if output_path in _FALSY_FALLBACKS:
+            expr = f"{expr} or {literal(_FALSY_FALLBACKS[output_path])}"
+        if env_key:
+            raw = env_var(env_key)
+            if kind is bool:
+                expr = f"({raw}.lower() in _TRUE_VALUES) if {raw} else {expr}"
+            elif kind is int:
+                expr = f"_parse_env_int({raw}) or {expr}"
+            else:
+                expr = f"{raw} or {expr}"
+
+        node = tree
+        for key in output_path[:-1]:
+            node = node.setdefault(key, {})
+        node[output_path[-1]] = expr
+
+    def render(node: Dict[str, Any], indent: int) -> List[str]:
+        pad = "    " * indent
+        lines = []
+        for key, value in node.items():
+            if isinstance(value, dict):
+                lines.append(f"{pad}{key!r}: {{")
+                lines.extend(render(value, indent + 1))
+                lines.append(f"{pad}}},")
+            else:
+                lines.append(f"{pad}{key!r}: {value},")
+        return lines
+
+    return "\n".join(
+        ["def _read_config(cd, env):"]
+        + prelude
+        + ["    return {"]
+        + render(tree, 2)
+        + ["    }", ""]
+    )
+
+
+# 模块加载时生成并编译配置读取函数（可通过 _READ_CONFIG_SOURCE 查看生成的源码）
+_READ_CONFIG_SOURCE = _generate_config_reader(_CONFIG_SCHEMA)
+_read_config_namespace: Dict[str, Any] = {
+    "_TRUE_VALUES": _TRUE_VALUES,
+    "_parse_env_int": _parse_env_int,
+}
+exec(compile(_READ_CONFIG_SOURCE, f"<{__name__}._read_config>", "exec"), _read_config_namespace)
+_read_config: Callable[[Dict, Mapping[str, str]], Dict[str, Any]] = (
+    _read_config_namespace["_read_config"]
+)
+
+
+# 支持多账号（";" 分隔）的 Webhook 配置项
+_MULTI_ACCOUNT_KEYS = (
+    "FEISHU_WEBHOOK_URL",
+    "DINGTALK_WEBHOOK_URL",
+    "WEWORK_WEBHOOK_URL",
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_CHAT_ID",
+    "NTFY_TOPIC",
+    "NTFY_TOKEN",
+    "BARK_URL",
+    "SLACK_WEBHOOK_URL",
+)
+
+
+def _collect_webhook_sources(
+    config: Dict, env: Mapping[str, str]
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    收集 Webhook 配置来源和已解析的多账号列表
 
-    return {
-        "ENABLED": enabled_env if enabled_env is not None else ai_summary.get("enabled", True),
-        "MODEL": _get_env_str("AI_SUMMARY_MODEL") or ai_summary.get("model", "deepseek-ai/DeepSeek-V3"),
-        "BASE_URL": _get_env_str("AI_SUMMARY_BASE_URL") or ai_summary.get("base_url", "https://api.deepseek.com"),
+    Returns:
+        (配置来源映射, 已解析的多账号列表) 元组
+    """
+    source_map = {
+        output_path[-1]: "环境变量" if env.get(env_key) else "配置文件"
+        for output_path, _, env_key, _, _ in _WEBHOOK_FIELDS
     }
-
-
-def _load_storage_config(config_data: Dict) -> Dict:
-    """加载存储配置"""
-    storage = config_data.get("storage", {})
-    formats = storage.get("formats", {})
-    local = storage.get("local", {})
-    remote = storage.get("remote", {})
-    pull = storage.get("pull", {})
-
-    txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
-    html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
-    pull_enabled_env = _get_env_bool("PULL_ENABLED")
-
-    return {
-        "BACKEND": _get_env_str("STORAGE_BACKEND") or storage.get("backend", "auto"),
-        "FORMATS": {
-            "SQLITE": formats.get("sqlite", True),
-            "TXT": txt_enabled_env if txt_enabled_env is not None else formats.get("txt", True),
-            "HTML": html_enabled_env if html_enabled_env is not None else formats.get("html", True),
-        },
-        "LOCAL": {
-            "DATA_DIR": local.get("data_dir", "output"),
-            "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
-        },
-        "REMOTE": {
-            "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
-            "BUCKET_NAME": _get_env_str("S3_BUCKET_NAME") or remote.get("bucket_name", ""),
-            "ACCESS_KEY_ID": _get_env_str("S3_ACCESS_KEY_ID") or remote.get("access_key_id", ""),
-            "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
-            "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
-            "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
-        },
-        "PULL": {
-            "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
-            "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
-        },
+    parsed_accounts = {
+        key: parse_multi_account_config(config[key]) for key in _MULTI_ACCOUNT_KEYS
     }
+    return source_map, parsed_accounts
 
 
-def _load_webhook_config(config_data: Dict) -> Dict:
-    """加载 Webhook 配置"""
-    notification = config_data.get("notification", {})
-    webhooks = notification.get("webhooks", {})
-
-    return {
-        # 飞书
-        "FEISHU_WEBHOOK_URL": _get_env_str("FEISHU_WEBHOOK_URL") or webhooks.get("feishu_url", ""),
-        # 钉钉
-        "DINGTALK_WEBHOOK_URL": _get_env_str("DINGTALK_WEBHOOK_URL") or webhooks.get("dingtalk_url", ""),
-        # 企业微信
-        "WEWORK_WEBHOOK_URL": _get_env_str("WEWORK_WEBHOOK_URL") or webhooks.get("wework_url", ""),
-        "WEWORK_MSG_TYPE": _get_env_str("WEWORK_MSG_TYPE") or webhooks.get("wework_msg_type", "markdown"),
-        # Telegram
-        "TELEGRAM_BOT_TOKEN": _get_env_str("TELEGRAM_BOT_TOKEN") or webhooks.get("telegram_bot_token", ""),
-        "TELEGRAM_CHAT_ID": _get_env_str("TELEGRAM_CHAT_ID") or webhooks.get("telegram_chat_id", ""),
-        # 邮件
-        "EMAIL_FROM": _get_env_str("EMAIL_FROM") or webhooks.get("email_from", ""),
-        "EMAIL_PASSWORD": _get_env_str("EMAIL_PASSWORD") or webhooks.get("email_password", ""),
-        "EMAIL_TO": _get_env_str("EMAIL_TO") or webhooks.get("email_to", ""),
-        "EMAIL_SMTP_SERVER": _get_env_str("EMAIL_SMTP_SERVER") or webhooks.get("email_smtp_server", ""),
-        "EMAIL_SMTP_PORT": _get_env_str("EMAIL_SMTP_PORT") or webhooks.get("email_smtp_port", ""),
-        # ntfy
-        "NTFY_SERVER_URL": _get_env_str("NTFY_SERVER_URL") or webhooks.get("ntfy_server_url") or "https://ntfy.sh",
-        "NTFY_TOPIC": _get_env_str("NTFY_TOPIC") or webhooks.get("ntfy_topic", ""),
-        "NTFY_TOKEN": _get_env_str("NTFY_TOKEN") or webhooks.get("ntfy_token", ""),
-        # Bark
-        "BARK_URL": _get_env_str("BARK_URL") or webhooks.get("bark_url", ""),
-        # Slack
-        "SLACK_WEBHOOK_URL": _get_env_str("SLACK_WEBHOOK_URL") or webhooks.get("slack_webhook_url", ""),
-    }
-
+def _print_notification_sources(
+    config: Dict,
+    source_map: Dict[str, str],
+    parsed_accounts: Dict[str, List[str]],
+) -> None:
+    """
+    打印通知渠道配置来源信息
 
-def _print_notification_sources(config: Dict) -> None:
-    """打印通知渠道配置来源信息"""
+    Args:
+        config: 完整配置字典
+        source_map: 配置项 -> 来源（环境变量/配置文件）
+        parsed_accounts: 配置项 -> 已解析的多账号列表
+    """
     notification_sources = []
     max_accounts = config["MAX_ACCOUNTS_PER_CHANNEL"]
 
-    if config["FEISHU_WEBHOOK_URL"]:
-        accounts = parse_multi_account_config(config["FEISHU_WEBHOOK_URL"])
-        count = min(len(accounts), max_accounts)
-        source = "环境变量" if os.environ.get("FEISHU_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"飞书({source}, {count}个账号)")
+    def add_multi_account_channel(label: str, key: str) -> None:
+        if config[key]:
+            count = min(len(parsed_accounts[key]), max_accounts)
+            notification_sources.append(f"{label}({source_map[key]}, {count}个账号)")
 
-    if config["DINGTALK_WEBHOOK_URL"]:
-        accounts = parse_multi_account_config(config["DINGTALK_WEBHOOK_URL"])
-        count = min(len(accounts), max_accounts)
-        source = "环境变量" if os.environ.get("DINGTALK_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"钉钉({source}, {count}个账号)")
-
-    if config["WEWORK_WEBHOOK_URL"]:
-        accounts = parse_multi_account_config(config["WEWORK_WEBHOOK_URL"])
-        count = min(len(accounts), max_accounts)
-        source = "环境变量" if os.environ.get("WEWORK_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"企业微信({source}, {count}个账号)")
+    add_multi_account_channel("飞书", "FEISHU_WEBHOOK_URL")
+    add_multi_account_channel("钉钉", "DINGTALK_WEBHOOK_URL")
+    add_multi_account_channel("企业微信", "WEWORK_WEBHOOK_URL")
 
     if config["TELEGRAM_BOT_TOKEN"] and config["TELEGRAM_CHAT_ID"]:
-        tokens = parse_multi_account_config(config["TELEGRAM_BOT_TOKEN"])
-        chat_ids = parse_multi_account_config(config["TELEGRAM_CHAT_ID"])
         valid, count = validate_paired_configs(
-            {"bot_token": tokens, "chat_id": chat_ids},
+            {
+                "bot_token": parsed_accounts["TELEGRAM_BOT_TOKEN"],
+                "chat_id": parsed_accounts["TELEGRAM_CHAT_ID"],
+            },
             "Telegram",
             required_keys=["bot_token", "chat_id"]
         )
         if valid and count > 0:
             count = min(count, max_accounts)
-            token_source = "环境变量" if os.environ.get("TELEGRAM_BOT_TOKEN") else "配置文件"
-            notification_sources.append(f"Telegram({token_source}, {count}个账号)")
+            notification_sources.append(f"Telegram({source_map['TELEGRAM_BOT_TOKEN']}, {count}个账号)")
 
     if config["EMAIL_FROM"] and config["EMAIL_PASSWORD"] and config["EMAIL_TO"]:
-        from_source = "环境变量" if os.environ.get("EMAIL_FROM") else "配置文件"
-        notification_sources.append(f"邮件({from_source})")
+        notification_sources.append(f"邮件({source_map['EMAIL_FROM']})")
 
     if config["NTFY_SERVER_URL"] and config["NTFY_TOPIC"]:
-        topics = parse_multi_account_config(config["NTFY_TOPIC"])
-        tokens = parse_multi_account_config(config["NTFY_TOKEN"])
+        topics = parsed_accounts["NTFY_TOPIC"]
+        tokens = parsed_accounts["NTFY_TOKEN"]
+        server_source = source_map["NTFY_SERVER_URL"]
         if tokens:
             valid, count = validate_paired_configs(
                 {"topic": topics, "token": tokens},
@@ -306,24 +433,13 @@ def _print_notification_sources(config: Dict) -> None:
             )
             if valid and count > 0:
                 count = min(count, max_accounts)
-                server_source = "环境变量" if os.environ.get("NTFY_SERVER_URL") else "配置文件"
                 notification_sources.append(f"ntfy({server_source}, {count}个账号)")
         else:
             count = min(len(topics), max_accounts)
-            server_source = "环境变量" if os.environ.get("NTFY_SERVER_URL") else "配置文件"
             notification_sources.append(f"ntfy({server_source}, {count}个账号)")
 
-    if config["BARK_URL"]:
-        accounts = parse_multi_account_config(config["BARK_URL"])
-        count = min(len(accounts), max_accounts)
-        bark_source = "环境变量" if os.environ.get("BARK_URL") else "配置文件"
-        notification_sources.append(f"Bark({bark_source}, {count}个账号)")
-
-    if config["SLACK_WEBHOOK_URL"]:
-        accounts = parse_multi_account_config(config["SLACK_WEBHOOK_URL"])
-        count = min(len(accounts), max_accounts)
-        slack_source = "环境变量" if os.environ.get("SLACK_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"Slack({slack_source}, {count}个账号)")
+    add_multi_account_channel("Bark", "BARK_URL")
+    add_multi_account_channel("Slack", "SLACK_WEBHOOK_URL")
 
     if notification_sources:
         print(f"通知渠道配置来源: {', '.join(notification_sources)}")
@@ -351,45 +467,18 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     if not Path(config_path).exists():
         raise FileNotFoundError(f"配置文件 {config_path} 不存在")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+    config_data = _read_yaml_config(config_path)
 
     print(f"配置文件加载成功: {config_path}")
 
-    # 合并所有配置
-    config = {}
-
-    # 应用配置
-    config.update(_load_app_config(config_data))
-
-    # 爬虫配置
-    config.update(_load_crawler_config(config_data))
-
-    # 报告配置
-    config.update(_load_report_config(config_data))
-
-    # 通知配置
-    config.update(_load_notification_config(config_data))
-
-    # 推送窗口配置
-    config["PUSH_WINDOW"] = _load_push_window_config(config_data)
-
-    # 权重配置
-    config["WEIGHT_CONFIG"] = _load_weight_config(config_data)
-
-    # 平台配置
-    config["PLATFORMS"] = config_data.get("platforms", [])
-
-    # 存储配置
-    config["STORAGE"] = _load_storage_config(config_data)
-
-    # AI 总结配置
-    config["AI_SUMMARY"] = _load_ai_summary_config(config_data)
+    # 环境变量只获取一次，各配置段共用
+    env = os.environ
 
-    # Webhook 配置
-    config.update(_load_webhook_config(config_data))
+    # 合并所有配置（由配置结构生成的扁平读取函数一次构造）
+    config = _read_config(config_data, env)
 
     # 打印通知渠道配置来源
-    _print_notification_sources(config)
+    source_map, parsed_accounts = _collect_webhook_sources(config, env)
+    _print_notification_sources(config, source_map, parsed_accounts)
 
     return config